@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from api.views import FEEDS, _parse_feeds, _prefetch_feeds
+
+
+class Command(BaseCommand):
+    help = 'Fetch every RSS feed and store new articles in the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=20,
+            help='Maximum number of articles to keep per category (default: 20)',
+        )
+
+    def handle(self, *args, **options):
+        limit = options['limit']
+        self.stdout.write('Fetching new articles from RSS feeds...')
+
+        # Download every feed concurrently up front; parsing below then hits the feed cache
+        _prefetch_feeds([url for feeds in FEEDS.values() for url in feeds])
+
+        new_articles_count = 0
+        for category, feeds in FEEDS.items():
+            try:
+                self.stdout.write(f'Fetching {category} news...')
+                items = _parse_feeds(feeds, category, limit=limit)
+                new_articles_count += len(items)
+                self.stdout.write(f'Fetched {len(items)} new {category} articles')
+            except Exception as e:
+                self.stdout.write(f'Error fetching {category} news: {str(e)}')
+
+        self.stdout.write(f'Fetched {new_articles_count} new articles from RSS feeds')
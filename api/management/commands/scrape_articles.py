@@ -1,10 +1,11 @@
-import re
-from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import timedelta
 
-import requests
 from django.core.management.base import BaseCommand
+from django.utils import timezone
 
 from api.models import Article
+from api.views import _fetch_article
 
 
 class Command(BaseCommand):
@@ -27,6 +28,12 @@ class Command(BaseCommand):
             action='store_true',
             help='Update articles that were scraped more than 1 hour ago',
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=16,
+            help='Number of concurrent fetches (default: 16)',
+        )
 
     def handle(self, *args, **options):
         if options['urls']:
@@ -34,8 +41,6 @@ class Command(BaseCommand):
         elif options['all']:
             urls = list(Article.objects.filter(is_scraped=False).values_list('url', flat=True))
         elif options['update_old']:
-            from datetime import timedelta
-            from django.utils import timezone
             one_hour_ago = timezone.now() - timedelta(hours=1)
             urls = list(Article.objects.filter(
                 scraped_at__lt=one_hour_ago
@@ -44,99 +49,47 @@ class Command(BaseCommand):
             self.stdout.write('Please specify --urls, --all, or --update-old')
             return
 
-        scraped_count = 0
-        for url in urls:
-            try:
+        # Fetch concurrently; database writes stay on this thread
+        results = []
+        with ThreadPoolExecutor(max_workers=max(1, options['workers'])) as executor:
+            futures = {}
+            for url in urls:
                 self.stdout.write(f'Scraping: {url}')
-                article_data = self._scrape_article_content(url)
-                if article_data:
-                    Article.objects.filter(url=url).update(
-                        title=article_data.get('title', ''),
-                        content=article_data.get('content', ''),
-                        is_scraped=True
-                    )
-                    scraped_count += 1
-                    self.stdout.write(f'Successfully scraped: {url}')
-                else:
-                    self.stdout.write(f'Failed to scrape: {url}')
-            except Exception as e:
-                self.stdout.write(f'Error scraping {url}: {str(e)}')
+                futures[executor.submit(self._scrape_article_content, url)] = url
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results.append((url, future.result()))
+                except Exception as e:
+                    self.stdout.write(f'Error scraping {url}: {str(e)}')
+
+        scraped = {}
+        for url, article_data in results:
+            if article_data:
+                scraped[url] = article_data
+                self.stdout.write(f'Successfully scraped: {url}')
+            else:
+                self.stdout.write(f'Failed to scrape: {url}')
+
+        # Write everything back in batched UPDATEs instead of one query per URL
+        articles = list(Article.objects.filter(url__in=scraped).only('id', 'url', 'title'))
+        for article in articles:
+            article_data = scraped[article.url]
+            article.title = article_data.get('title') or article.title
+            article.content = article_data.get('content') or ''
+            article.is_scraped = True
+        scraped_count = 0
+        try:
+            Article.objects.bulk_update(articles, ['title', 'content', 'is_scraped'], batch_size=500)
+            scraped_count = len(articles)
+        except Exception as e:
+            self.stdout.write(f'Error saving scraped articles: {str(e)}')
 
         self.stdout.write(f'Scraped {scraped_count} articles successfully')
 
     def _scrape_article_content(self, url):
-        SCRAPE_WHITELIST = (
-            'espn.com', 'www.espn.com',
-            'techcrunch.com', 'www.techcrunch.com',
-            'aljazeera.com', 'www.aljazeera.com'
-        )
-
+        # Same whitelist, session and extraction as the API, without its cache
         try:
-            host = urlparse(url).hostname or ''
-            if not any(host.endswith(d) for d in SCRAPE_WHITELIST):
-                return None
-
-            headers = {'User-Agent': 'FeedScribe/1.0'}
-            resp = requests.get(url, headers=headers, timeout=10)
-            if resp.status_code != 200:
-                return None
-
-            html = resp.text
-
-            # Extract title
-            title = None
-            title_patterns = [
-                r'<title[^>]*>([^<]+)</title>',
-                r'<meta[^>]+property=["\']og:title["\'][^>]+content=["\']([^"\']+)',
-                r'<h1[^>]*>([^<]+)</h1>',
-            ]
-            for pat in title_patterns:
-                m = re.search(pat, html, flags=re.IGNORECASE)
-                if m:
-                    title = m.group(1).strip()
-                    break
-
-            # Extract article content
-            content = None
-
-            # First try to find main article containers
-            content_selectors = [
-                r'<article[^>]*>(.*?)</article>',
-                r'<div[^>]*class=["\'][^"\']*article[^"\']*["\'][^>]*>(.*?)</div>',
-                r'<div[^>]*class=["\'][^"\']*content[^"\']*["\'][^>]*>(.*?)</div>',
-                r'<div[^>]*class=["\'][^"\']*post[^"\']*["\'][^>]*>(.*?)</div>',
-                r'<div[^>]*id=["\'][^"\']*content[^"\']*["\'][^>]*>(.*?)</div>',
-                r'<div[^>]*id=["\'][^"\']*article[^"\']*["\'][^>]*>(.*?)</div>',
-            ]
-
-            for pat in content_selectors:
-                m = re.search(pat, html, flags=re.IGNORECASE | re.DOTALL)
-                if m:
-                    raw_content = m.group(1)
-                    # Remove scripts and styles
-                    raw_content = re.sub(r'<script[^>]*>.*?</script>', '', raw_content, flags=re.IGNORECASE | re.DOTALL)
-                    raw_content = re.sub(r'<style[^>]*>.*?</style>', '', raw_content, flags=re.IGNORECASE | re.DOTALL)
-                    # Extract text from paragraphs and other elements
-                    paragraphs = re.findall(r'<p[^>]*>(.*?)</p>', raw_content, flags=re.IGNORECASE | re.DOTALL)
-                    if paragraphs:
-                        content = ' '.join(re.sub(r'<[^>]+>', '', p).strip() for p in paragraphs if p.strip())
-                    else:
-                        # Fallback to general text extraction
-                        content = re.sub(r'<[^>]+>', '', raw_content).strip()
-                    if len(content) > 200:  # Require more substantial content
-                        break
-
-            # If no content found with selectors, try extracting all paragraphs from the page
-            if not content or len(content) < 200:
-                all_paragraphs = re.findall(r'<p[^>]*>(.*?)</p>', html, flags=re.IGNORECASE | re.DOTALL)
-                if all_paragraphs:
-                    content = ' '.join(re.sub(r'<[^>]+>', '', p).strip() for p in all_paragraphs if p.strip() and len(p.strip()) > 20)
-
-            if title or content:
-                return {
-                    'title': title,
-                    'content': content,
-                }
-            return None
+            return _fetch_article(url)
         except Exception:
-            return None
\ No newline at end of file
+            return None
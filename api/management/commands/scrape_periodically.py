@@ -1,7 +1,12 @@
+import signal
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import schedule
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
+from django.db import connection
 
 from api.models import Article
 
@@ -21,49 +26,62 @@ class Command(BaseCommand):
         interval = options['interval']
         self.stdout.write(f'Starting periodic scraping every {interval} seconds...')
 
-        while True:
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._request_stop)
+
+        # Article scraping and RSS fetching are independent, so each cycle runs them side by side
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='scrape-cycle')
+        schedule.every(interval).seconds.do(self._run_cycle)
+        try:
+            self._run_cycle()
+            while schedule.get_jobs():
+                schedule.run_pending()
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stdout.write('Stopping periodic scraping...')
+            schedule.clear()
+            self._executor.shutdown(wait=True)
+
+    def _request_stop(self, signum, frame):
+        self._stopping = True
+        # Unschedule right away so the main loop exits on its next tick
+        schedule.clear()
+
+    def _run_cycle(self):
+        if self._stopping:
+            return schedule.CancelJob
+
+        self.stdout.write(f'[{datetime.now()}] Starting scraping cycle...')
+        futures = [
+            self._executor.submit(self._scrape_articles),
+            self._executor.submit(self._fetch_rss),
+        ]
+        for future in futures:
             try:
-                self.stdout.write(f'[{datetime.now()}] Starting scraping cycle...')
-
-                # Get all unscraped articles
-                unscraped_urls = list(Article.objects.filter(is_scraped=False).values_list('url', flat=True))
-
-                # Scrape unscraped articles
-                if unscraped_urls:
-                    self.stdout.write(f'Found {len(unscraped_urls)} unscraped articles')
-
-                    # Scrape them
-                    from django.core.management import call_command
-                    call_command('scrape_articles', urls=unscraped_urls)
-
-                # Also update old articles
-                from django.core.management import call_command
-                call_command('scrape_articles', update_old=True)
-
-                # Fetch new articles from RSS feeds
-                self.stdout.write('Fetching new articles from RSS feeds...')
-                from api.views import FEEDS, _parse_feeds
-                new_articles_count = 0
-                for category, feeds in FEEDS.items():
-                    try:
-                        self.stdout.write(f'Fetching {category} news...')
-                        items = _parse_feeds(feeds, category, limit=20)  # Fetch up to 20 new articles per category
-                        new_articles_count += len(items)
-                        self.stdout.write(f'Fetched {len(items)} new {category} articles')
-                    except Exception as e:
-                        self.stdout.write(f'Error fetching {category} news: {str(e)}')
-
-                self.stdout.write(f'Fetched {new_articles_count} new articles from RSS feeds')
-
-                self.stdout.write(f'[{datetime.now()}] Scraping cycle completed')
-
-                # Wait for next cycle
-                self.stdout.write(f'Waiting {interval} seconds until next cycle...')
-                time.sleep(interval)
-
-            except KeyboardInterrupt:
-                self.stdout.write('Stopping periodic scraping...')
-                break
+                future.result()
             except Exception as e:
                 self.stdout.write(f'Error in scraping cycle: {str(e)}')
-                time.sleep(interval)
\ No newline at end of file
+        self.stdout.write(f'[{datetime.now()}] Scraping cycle completed')
+
+    def _scrape_articles(self):
+        try:
+            # Get all unscraped articles
+            unscraped_urls = list(Article.objects.filter(is_scraped=False).values_list('url', flat=True))
+
+            # Scrape unscraped articles
+            if unscraped_urls:
+                self.stdout.write(f'Found {len(unscraped_urls)} unscraped articles')
+                call_command('scrape_articles', urls=unscraped_urls)
+
+            # Also update old articles
+            call_command('scrape_articles', update_old=True)
+        finally:
+            connection.close()
+
+    def _fetch_rss(self):
+        try:
+            call_command('refresh_feeds', limit=20)  # Fetch up to 20 new articles per category
+        finally:
+            connection.close()
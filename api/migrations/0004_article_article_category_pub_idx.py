@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 11:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_article_article_is_scraped_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(fields=['category', '-published_at'], name='article_category_pub_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:05
+
+from django.db import migrations
+from django.db.models.functions import Lower
+
+
+def lowercase_categories(apps, schema_editor):
+    Article = apps.get_model('api', 'Article')
+    Article.objects.update(category=Lower('category'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_article_article_category_pub_idx'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_categories, migrations.RunPython.noop),
+    ]
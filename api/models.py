@@ -18,6 +18,12 @@ class Article(models.Model):
 
     class Meta:
         ordering = ['-published_at']
+        indexes = [
+            models.Index(fields=['is_scraped'], name='article_is_scraped_idx'),
+            models.Index(fields=['scraped_at'], name='article_scraped_at_idx'),
+            models.Index(fields=['-published_at'], name='article_published_at_idx'),
+            models.Index(fields=['category', '-published_at'], name='article_category_pub_idx'),
+        ]
 
     def __str__(self):
         return self.title or self.url
\ No newline at end of file
@@ -3,7 +3,8 @@ from . import views
 
 urlpatterns = [
     path('news', views.news_list, name='news_list'),
-    path('news/<str:item_id>', views.news_detail, name='news_detail'),
+    path('news/<int:pk>', views.news_detail, name='news_detail'),
+    path('news/<str:item_id>', views.news_detail_legacy, name='news_detail_legacy'),
     path('trending', views.trending, name='trending'),
     path('music', views.music_search, name='music_search'),
     path('music/<int:track_id>', views.music_detail, name='music_detail'),
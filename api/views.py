@@ -1,221 +1,291 @@
 import base64
-import random
+import calendar
 import re
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime, timezone as dt_timezone
+from email.utils import mktime_tz, parsedate_to_datetime, parsedate_tz
+from functools import lru_cache
 from typing import List, Dict
+from urllib.parse import urlparse
 
 import feedparser
+import orjson
 import requests
 from django.core.cache import cache
-from django.http import JsonResponse
+from django.db import connection, transaction
+from django.http import HttpResponse
 from django.utils import timezone as django_timezone
 from django.views.decorators.http import require_GET
+from feedparser import FeedParserDict
+from lxml import etree, html as lxml_html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .models import Article
 
+# Shared HTTP session so repeated calls to the same host reuse kept-alive connections
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0', 'Accept-Encoding': 'gzip, deflate'})
+_ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False),
+)
+_SESSION.mount('http://', _ADAPTER)
+_SESSION.mount('https://', _ADAPTER)
+_TIMEOUT = (3, 10)  # (connect, read) seconds
+
+
+class OrjsonResponse(HttpResponse):
+    """JSON response serialized with orjson, which writes bytes directly.
+
+    Already-encoded bytes (e.g. a cached body) are sent as-is.
+    """
 
-def _encode_id(link: str) -> str:
-    return base64.urlsafe_b64encode(link.encode()).decode().rstrip('=')
+    def __init__(self, data, **kwargs):
+        kwargs.setdefault('content_type', 'application/json')
+        if not isinstance(data, bytes):
+            data = orjson.dumps(data)
+        super().__init__(content=data, **kwargs)
 
 
 def _decode_id(item_id: str) -> str:
+    """Decode a base64 URL id handed out before items were keyed by primary key."""
     pad = '=' * (-len(item_id) % 4)
     return base64.urlsafe_b64decode((item_id + pad).encode()).decode()
 
 
+def _stable_int(key: str, low: int, high: int) -> int:
+    """Deterministic stand-in for random.randint(low, high) keyed on a stable string."""
+    return low + zlib.crc32(key.encode()) % (high - low + 1)
+
+
+@lru_cache(maxsize=4096)
 def _estimate_read_time(text: str) -> str:
-    words = max(1, len(text.split()))
+    # counting spaces is close enough for prose and avoids building a word list
+    words = max(1, text.count(' ') + 1)
     minutes = max(1, int(words / 200))
     return f"{minutes} min read"
 
 
-def _format_datetime(dt) -> str:
-    """Format datetime for frontend consumption"""
+def _format_datetime(dt) -> str | None:
+    """Format datetime for frontend consumption as UTC ISO-8601 with a Z suffix"""
     if not dt:
         return None
-
-    # Ensure datetime is timezone-aware
+    # Stored datetimes are already UTC (USE_TZ with TIME_ZONE='UTC'), so this is usually a no-op
     if dt.tzinfo is None:
-        dt = django_timezone.make_aware(dt)
-
-    # Convert to UTC for consistent API responses
-    dt_utc = dt.astimezone(dt_timezone.utc)
-
-    # Return ISO format with Z suffix (standard for UTC)
-    return dt_utc.isoformat().replace('+00:00', 'Z')
-
-# Simple OG image cache and scraper for whitelisted domains
-_OG_CACHE: Dict[str, str] = {}
-_ARTICLE_CACHE: Dict[str, Dict] = {}
+        dt = dt.replace(tzinfo=dt_timezone.utc)
+    elif dt.utcoffset():
+        dt = dt.astimezone(dt_timezone.utc)
+    return dt.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+# OG image and article scraper for whitelisted domains; results go through the
+# Django cache so they expire and are shared between workers
+_SCRAPE_TTL = 60 * 60 * 24
+_OG_MISS_TTL = 60 * 60
+_MAX_HTML_BYTES = 512 * 1024
 _SCRAPE_WHITELIST = (
     'espn.com', 'www.espn.com',
     'techcrunch.com', 'www.techcrunch.com',
     'aljazeera.com', 'www.aljazeera.com'
 )
 
+# Article extraction: title sources and main content containers, most specific first
+_TITLE_XPATHS = (
+    '//meta[@property="og:title"]/@content',
+    '//title',
+    '//h1',
+)
+_CONTENT_XPATHS = (
+    '//article',
+    '//div[contains(@class, "article")]',
+    '//div[contains(@class, "content")]',
+    '//div[contains(@class, "post")]',
+    '//div[contains(@id, "content")]',
+    '//div[contains(@id, "article")]',
+)
+
+# Regexes used per feed entry, compiled once at import
+_TAG_RE = re.compile(r'<[^>]+>')
+_OG_IMAGE_RES = [re.compile(p, re.IGNORECASE) for p in (
+    r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)',
+    r'<meta[^>]+name=["\']twitter:image["\'][^>]+content=["\']([^"\']+)',
+    r'<link[^>]+rel=["\']image_src["\'][^>]+href=["\']([^"\']+)',
+)]
+_IMG_SRC_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)', re.IGNORECASE)
+_CHARSET_RE = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+
 def _scrape_og_image(url: str) -> str | None:
     try:
-        from urllib.parse import urlparse
         host = urlparse(url).hostname or ''
         if not any(host.endswith(d) for d in _SCRAPE_WHITELIST):
             return None
-        if url in _OG_CACHE:
-            return _OG_CACHE[url]
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        resp = requests.get(url, headers=headers, timeout=4)
-        if resp.status_code != 200:
-            return None
-        html = resp.text
-        import re
-        # look for og:image then twitter:image, then link rel=image_src
-        patterns = [
-            r'<meta[^>]+property=["\']og:image["\'][^>]+content=["\']([^"\']+)',
-            r'<meta[^>]+name=["\']twitter:image["\'][^>]+content=["\']([^"\']+)',
-            r'<link[^>]+rel=["\']image_src["\'][^>]+href=["\']([^"\']+)',
-        ]
-        for pat in patterns:
-            m = re.search(pat, html, flags=re.IGNORECASE)
-            if m:
-                src = m.group(1)
-                if src.startswith('//'):
-                    src = 'https:' + src
-                if src.startswith('http'):
-                    _OG_CACHE[url] = src
-                    return src
+        key = f"og_{url}"
+        cached = cache.get(key)
+        if cached is not None:
+            return cached or None  # '' marks a page we recently failed to find an image on
+        resp = _SESSION.get(url, timeout=(3, 4))
+        if resp.status_code == 200:
+            html = resp.text
+            # look for og:image then twitter:image, then link rel=image_src
+            for pat in _OG_IMAGE_RES:
+                m = pat.search(html)
+                if m:
+                    src = m.group(1)
+                    if src.startswith('//'):
+                        src = 'https:' + src
+                    if src.startswith('http'):
+                        cache.set(key, src, _SCRAPE_TTL)
+                        return src
+        # Remember the miss so feed refreshes don't re-download the page every cycle
+        cache.set(key, '', _OG_MISS_TTL)
         return None
     except Exception:
         return None
 
 
-def _scrape_article_content(url: str) -> Dict | None:
-    try:
-        from urllib.parse import urlparse
-        host = urlparse(url).hostname or ''
-        if not any(host.endswith(d) for d in _SCRAPE_WHITELIST):
-            return None
+def _extract_article(html: bytes, charset: str | None = None) -> tuple[str | None, str | None]:
+    """Extract (title, content) from an article page with a single lxml parse.
+    ``charset`` comes from the Content-Type header; without it lxml sniffs the page's meta tag.
+    """
+    parser = None
+    if charset:
+        try:
+            parser = lxml_html.HTMLParser(encoding=charset)
+        except LookupError:  # unknown charset label: let lxml sniff instead
+            pass
+    if parser is not None:
+        doc = lxml_html.document_fromstring(html, parser=parser)
+    else:
+        doc = lxml_html.fromstring(html)
+    # Drop scripts and styles once so they never leak into text_content()
+    etree.strip_elements(doc, 'script', 'style', with_tail=False)
+
+    title = None
+    for path in _TITLE_XPATHS:
+        value = doc.xpath(f'normalize-space(({path})[1])')
+        if value:
+            title = value
+            break
+
+    content = None
+    # First try to find main article containers
+    for path in _CONTENT_XPATHS:
+        nodes = doc.xpath(f'({path})[1]')
+        if not nodes:
+            continue
+        paragraphs = nodes[0].xpath('.//p')
+        if paragraphs:
+            content = ' '.join(t for t in (p.text_content().strip() for p in paragraphs) if t)
+        else:
+            # Fallback to general text extraction
+            content = nodes[0].text_content().strip()
+        if len(content) > 200:  # Require more substantial content
+            break
+
+    # If no content found with containers, try extracting all paragraphs from the page
+    if not content or len(content) < 200:
+        all_paragraphs = [p.text_content().strip() for p in doc.xpath('//p')]
+        if all_paragraphs:
+            content = ' '.join(p for p in all_paragraphs if len(p) > 20)
+
+    return title, content
 
-        if url in _ARTICLE_CACHE:
-            return _ARTICLE_CACHE[url]
 
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        resp = requests.get(url, headers=headers, timeout=10)
+def _fetch_article(url: str) -> Dict | None:
+    """Download and extract a whitelisted article page, bypassing the cache."""
+    host = urlparse(url).hostname or ''
+    if not any(host.endswith(d) for d in _SCRAPE_WHITELIST):
+        return None
+
+    # Stream and read at most _MAX_HTML_BYTES; lxml copes with the truncated markup
+    with _SESSION.get(url, timeout=_TIMEOUT, stream=True) as resp:
         if resp.status_code != 200:
             return None
+        if not resp.headers.get('Content-Type', '').startswith('text/html'):
+            return None
+        # Not resp.encoding: requests falls back to ISO-8859-1 for text/html without a charset
+        match = _CHARSET_RE.search(resp.headers['Content-Type'])
+        body = resp.raw.read(_MAX_HTML_BYTES, decode_content=True)
 
-        html = resp.text
-
-        # Extract title
-        title = None
-        title_patterns = [
-            r'<title[^>]*>([^<]+)</title>',
-            r'<meta[^>]+property=["\']og:title["\'][^>]+content=["\']([^"\']+)',
-            r'<h1[^>]*>([^<]+)</h1>',
-        ]
-        for pat in title_patterns:
-            m = re.search(pat, html, flags=re.IGNORECASE)
-            if m:
-                title = m.group(1).strip()
-                break
-
-        # Extract article content - try multiple approaches
-        content = None
-
-        # First try to find main article containers
-        content_selectors = [
-            r'<article[^>]*>(.*?)</article>',
-            r'<div[^>]*class=["\'][^"\']*article[^"\']*["\'][^>]*>(.*?)</div>',
-            r'<div[^>]*class=["\'][^"\']*content[^"\']*["\'][^>]*>(.*?)</div>',
-            r'<div[^>]*class=["\'][^"\']*post[^"\']*["\'][^>]*>(.*?)</div>',
-            r'<div[^>]*id=["\'][^"\']*content[^"\']*["\'][^>]*>(.*?)</div>',
-            r'<div[^>]*id=["\'][^"\']*article[^"\']*["\'][^>]*>(.*?)</div>',
-        ]
-
-        for pat in content_selectors:
-            m = re.search(pat, html, flags=re.IGNORECASE | re.DOTALL)
-            if m:
-                raw_content = m.group(1)
-                # Remove scripts and styles
-                raw_content = re.sub(r'<script[^>]*>.*?</script>', '', raw_content, flags=re.IGNORECASE | re.DOTALL)
-                raw_content = re.sub(r'<style[^>]*>.*?</style>', '', raw_content, flags=re.IGNORECASE | re.DOTALL)
-                # Extract text from paragraphs and other elements
-                paragraphs = re.findall(r'<p[^>]*>(.*?)</p>', raw_content, flags=re.IGNORECASE | re.DOTALL)
-                if paragraphs:
-                    content = ' '.join(re.sub(r'<[^>]+>', '', p).strip() for p in paragraphs if p.strip())
-                else:
-                    # Fallback to general text extraction
-                    content = re.sub(r'<[^>]+>', '', raw_content).strip()
-                if len(content) > 200:  # Require more substantial content
-                    break
-
-        # If no content found with selectors, try extracting all paragraphs from the page
-        if not content or len(content) < 200:
-            all_paragraphs = re.findall(r'<p[^>]*>(.*?)</p>', html, flags=re.IGNORECASE | re.DOTALL)
-            if all_paragraphs:
-                content = ' '.join(re.sub(r'<[^>]+>', '', p).strip() for p in all_paragraphs if p.strip() and len(p.strip()) > 20)
-
-        if title or content:
-            article_data = {
-                'title': title,
-                'content': content,
-                'scraped': True
-            }
-            _ARTICLE_CACHE[url] = article_data
-            return article_data
-        return None
+    title, content = _extract_article(body, match and match.group(1))
+    if title or content:
+        return {'title': title, 'content': content}
+    return None
+
+
+def _scrape_article_content(url: str) -> Dict | None:
+    try:
+        key = f"article_{url}"
+        cached = cache.get(key)
+        if cached:
+            return cached
+
+        article_data = _fetch_article(url)
+        if article_data:
+            article_data['scraped'] = True
+            cache.set(key, article_data, _SCRAPE_TTL)
+        return article_data
     except Exception:
         return None
 
 
-def _pick_image(entry, category: str) -> str:
-    """Pick a representative image for a feed entry, avoiding generic logos.
-    Strategy:
-    1) Collect candidates from media:content, media:thumbnail, link enclosures, and inline HTML images.
-    2) Prefer non-generic images (skip logos/sprites/icons/placeholders) and normalize protocol-relative URLs.
-    3) Fallback to the first valid candidate, else category-specific placeholder.
-    """
-    import re
+# common generic/logo patterns seen across feeds (esp. ESPN), plus too-small images
+# (thumbnails or tracking pixels), folded into one scan
+_GENERIC_IMG_RE = re.compile(
+    r'logo|sprite|icon|placeholder|default|branding|og-default|'
+    r'/i/espn/|espn_logo|branding\.svg|favicon|badge|'
+    r'[?&]w=\d{1,2}(?:&|$)',
+    re.IGNORECASE,
+)
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp', '.gif')
+_INLINE_IMAGE_KEYS = ('summary', 'description')
+_PLACEHOLDER_IMAGE = 'https://picsum.photos/seed/{}-news/800/400'
 
-    def norm(u: str | None) -> str | None:
-        if not u:
-            return None
-        if u.startswith('//'):
-            return 'https:' + u
-        return u
-
-    def is_valid(u: str | None) -> bool:
-        if not u:
-            return False
-        u = u.lower()
-        return u.startswith('http://') or u.startswith('https://') or u.startswith('//')
-
-    def is_generic(u: str) -> bool:
-        s = u.lower()
-        # common generic/logo patterns seen across feeds (esp. ESPN)
-        generic_keywords = [
-            'logo', 'sprite', 'icon', 'placeholder', 'default', 'branding', 'og-default',
-            '/i/espn/', 'espn_logo', 'branding.svg', 'favicon', 'badge'
-        ]
-        if any(k in s for k in generic_keywords):
-            return True
-        # too small images (thumbnails or tracking pixels)
-        if re.search(r'[\?&]w=\d{1,2}(?:&|$)', s):
-            return True
+
+def _norm_image_url(u: str | None) -> str | None:
+    if not u:
+        return None
+    if u.startswith('//'):
+        return 'https:' + u
+    return u
+
+
+def _is_valid_image_url(u: str | None) -> bool:
+    if not u:
         return False
+    u = u.lower()
+    return u.startswith('http://') or u.startswith('https://') or u.startswith('//')
+
 
-    candidates: list[str] = []
+def _is_generic_image(u: str) -> bool:
+    return bool(_GENERIC_IMG_RE.search(u))
+
+
+def _first_img(html: str) -> str | None:
+    """First <img src> in an HTML fragment, ignoring inline data: URIs."""
+    m = _IMG_SRC_RE.search(html or '')
+    if not m:
+        return None
+    src = m.group(1)
+    if src.startswith('data:'):
+        return None
+    return src
 
+
+def _image_candidates(entry):
+    """Yield image URLs for a feed entry lazily, so later sources are only inspected when needed."""
     # media:content and media:thumbnail
-    media_content = entry.get('media_content') or []
-    if isinstance(media_content, list):
-        for mc in media_content:
-            u = mc.get('url')
-            if is_valid(u):
-                candidates.append(u)
-    media_thumbnail = entry.get('media_thumbnail') or []
-    if isinstance(media_thumbnail, list):
-        for mt in media_thumbnail:
-            u = mt.get('url')
-            if is_valid(u):
-                candidates.append(u)
+    for key in ('media_content', 'media_thumbnail'):
+        media = entry.get(key) or []
+        if isinstance(media, list):
+            for m in media:
+                u = m.get('url')
+                if _is_valid_image_url(u):
+                    yield u
 
     # enclosures/links with image type or extension
     links = entry.get('links') or []
@@ -225,53 +295,54 @@ def _pick_image(entry, category: str) -> str:
                 rel = (l.get('rel') or '').lower()
                 href = l.get('href')
                 typ = (l.get('type') or '').lower()
-                if is_valid(href) and (rel == 'enclosure' or 'image' in typ or str(href).lower().endswith((".jpg", ".jpeg", ".png", ".webp", ".gif"))):
-                    candidates.append(href)
+                if _is_valid_image_url(href) and (rel == 'enclosure' or 'image' in typ or str(href).lower().endswith(_IMAGE_EXTENSIONS)):
+                    yield href
             except Exception:
                 continue
 
     # first <img src> in content/summary/description
-    def first_img(html: str) -> str | None:
-        m = re.search(r'<img[^>]+src=["\']([^"\']+)', html or '', flags=re.IGNORECASE)
-        if not m:
-            return None
-        src = m.group(1)
-        if src.startswith('data:'):
-            return None
-        return src
-
     content = entry.get('content') or []
     if isinstance(content, list) and content:
-        html = content[0].get('value') or ''
-        img = first_img(html)
-        if is_valid(img):
-            candidates.append(img) 
-    for key in ['summary', 'description']:
+        img = _first_img(content[0].get('value') or '')
+        if _is_valid_image_url(img):
+            yield img
+    for key in _INLINE_IMAGE_KEYS:
         html = entry.get(key) or ''
         if isinstance(html, str):
-            img = first_img(html)
-            if is_valid(img):
-                candidates.append(img)
+            img = _first_img(html)
+            if _is_valid_image_url(img):
+                yield img
+
 
+def _pick_image(entry, category: str) -> str:
+    """Pick a representative image for a feed entry, avoiding generic logos.
+    Strategy:
+    1) Walk candidates from media:content, media:thumbnail, link enclosures, and inline HTML images.
+    2) Return the first non-generic image (skip logos/sprites/icons/placeholders), normalizing protocol-relative URLs.
+    3) Fallback to the first valid candidate, else category-specific placeholder.
+    """
     # choose first non-generic candidate
-    for u in candidates:
-        nu = norm(u) or ''
-        if not is_generic(nu):
+    fallback = None
+    for u in _image_candidates(entry):
+        nu = _norm_image_url(u)
+        if not _is_generic_image(nu):
             return nu
+        if fallback is None:
+            fallback = nu
 
-    # try scraping og:image for known domains if candidates are generic
-    link = entry.get('link') or ''
-    og = _scrape_og_image(link)
+    # try scraping og:image for known domains if candidates are generic; this is the
+    # only step that can hit the network, so it runs after every feed-provided source
+    link = entry.get('link')
+    og = _scrape_og_image(link) if link else None
     if og:
         return og
 
     # otherwise return first valid candidate if any
-    if candidates:
-        return norm(candidates[0]) or candidates[0]
+    if fallback:
+        return fallback
 
     # Fallback to a category-specific placeholder
-    seed = (category or 'news').lower().replace(' ', '-')
-    return f'https://picsum.photos/seed/{seed}-news/800/400'
+    return _PLACEHOLDER_IMAGE.format((category or 'news').lower().replace(' ', '-'))
 
 
 FEEDS = {
@@ -297,13 +368,142 @@ FEEDS = {
         'https://www.vanguardngr.com/feed/',
       ],
 }
+# Articles store these lowercase keys as their category; display casing is the frontend's job
+CATEGORIES = tuple(FEEDS)
+
+
+# Last response per feed URL, kept for ETag/Last-Modified conditional GETs
+_FEED_CACHE: Dict[str, tuple] = {}
+_FEED_TTL = 300  # matches the scrape_periodically interval
+_FEED_TIMEOUT = (3, 8)  # feeds are small; don't let one slow host hold up a category
+# Shared by all requests so concurrent views don't each spin up their own threads
+_FEED_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='feeds')
+
+
+# Plain RSS 2.0 is parsed directly with lxml; anything else goes through feedparser
+_FEED_XML_PARSER = etree.XMLParser(recover=True, huge_tree=False, resolve_entities=False, no_network=True)
+_MEDIA_NS = '{http://search.yahoo.com/mrss/}'
+_CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+_DC_CREATOR = '{http://purl.org/dc/elements/1.1/}creator'
+
+
+def _fast_feed_parse(body: bytes) -> FeedParserDict | None:
+    """Parse an RSS 2.0 document into the feedparser fields _parse_feeds and _pick_image read.
+    Returns None for anything that isn't RSS 2.0 (Atom, RDF, unparseable) so callers fall back to feedparser.
+    """
+    try:
+        root = etree.fromstring(body, parser=_FEED_XML_PARSER)
+    except (etree.XMLSyntaxError, ValueError):
+        return None
+    if root is None or root.tag != 'rss':
+        return None
+    channel = root.find('channel')
+    if channel is None:
+        return None
+
+    entries = []
+    for item in channel.iterfind('item'):
+        entry = FeedParserDict()
+        link = (item.findtext('link') or '').strip()
+        if not link:
+            # like feedparser, a permalink guid stands in for a missing <link>
+            guid = item.find('guid')
+            if guid is not None and guid.get('isPermaLink', 'true').lower() != 'false':
+                link = (guid.text or '').strip()
+        links = []
+        if link:
+            entry['link'] = link
+            links.append({'rel': 'alternate', 'type': 'text/html', 'href': link})
+        title = item.findtext('title')
+        if title is not None:
+            entry['title'] = title.strip()
+        summary = item.findtext('description')
+        if summary is not None:
+            entry['summary'] = summary
+        author = item.findtext(_DC_CREATOR) or item.findtext('author')
+        if author:
+            entry['author'] = author.strip()
+        published = item.findtext('pubDate')
+        if published:
+            entry['published'] = published
+            date = parsedate_tz(published)
+            if date:
+                entry['published_parsed'] = time.gmtime(mktime_tz(date))
+        encoded = item.findtext(_CONTENT_ENCODED)
+        if encoded:
+            entry['content'] = [{'value': encoded}]
+        media_content = [{'url': m.get('url')} for m in item.iter(f'{_MEDIA_NS}content') if m.get('url')]
+        if media_content:
+            entry['media_content'] = media_content
+        media_thumbnail = [{'url': m.get('url')} for m in item.iter(f'{_MEDIA_NS}thumbnail') if m.get('url')]
+        if media_thumbnail:
+            entry['media_thumbnail'] = media_thumbnail
+        for enclosure in item.iterfind('enclosure'):
+            if enclosure.get('url'):
+                links.append({'rel': 'enclosure', 'type': enclosure.get('type', ''), 'href': enclosure.get('url')})
+        entry['links'] = links
+        entries.append(entry)
+
+    return FeedParserDict(
+        feed=FeedParserDict(title=(channel.findtext('title') or '').strip() or 'Source'),
+        entries=entries,
+        bozo=0,
+    )
+
+
+def _fetch_feed(url: str):
+    """Fetch and parse a feed, sharing results through the cache.
+    Feeds are downloaded on the pooled session; refetches send the previous
+    ETag/Last-Modified so unchanged feeds come back as 304 and reuse the last parse.
+    A failed download yields the last good parse, or an empty feed.
+    """
+    key = f"feed_{url}"
+    parsed = cache.get(key)
+    if parsed is not None:
+        return parsed
+
+    etag, modified, previous = _FEED_CACHE.get(url, (None, None, None))
+    headers = {}
+    if previous is not None:
+        if etag:
+            headers['If-None-Match'] = etag
+        if modified:
+            headers['If-Modified-Since'] = modified
+    try:
+        resp = _SESSION.get(url, headers=headers, timeout=_FEED_TIMEOUT)
+        if resp.status_code != 304 or previous is None:
+            resp.raise_for_status()
+    except requests.RequestException as ex:
+        print(f"Error fetching feed {url}: {ex}")
+        # Serve the last good parse if there is one; otherwise an empty feed
+        return previous if previous is not None else feedparser.parse(b'')
+    if resp.status_code == 304 and previous is not None:
+        parsed = previous
+    else:
+        parsed = _fast_feed_parse(resp.content)
+        if parsed is None:
+            parsed = feedparser.parse(resp.content)
+            # exceptions are not reliably picklable, and only the entries are used
+            parsed.pop('bozo_exception', None)
+        _FEED_CACHE[url] = (resp.headers.get('ETag'), resp.headers.get('Last-Modified'), parsed)
+    cache.set(key, parsed, _FEED_TTL)
+    return parsed
+
+
+def _prefetch_feeds(urls: List[str]) -> None:
+    """Warm the feed cache for many feeds at once, fetching them concurrently."""
+    # failures are left for _parse_feeds to retry and report per feed
+    wait([_FEED_POOL.submit(_fetch_feed, url) for url in urls])
 
 
 def _parse_feeds(feeds: List[str], category: str, limit: int = 12) -> List[Dict]:
     items: List[Dict] = []
-    for url in feeds:
+    articles: Dict[str, Article] = {}
+    # Fetch every feed concurrently; entries are processed (and saved) on this thread
+    futures = [(url, _FEED_POOL.submit(_fetch_feed, url)) for url in feeds]
+    for url, future in futures:
         try:
-            parsed = feedparser.parse(url)
+            parsed = future.result()
             source_title = parsed.feed.get('title', 'Source')
             for e in parsed.entries:
                 link = e.get('link', '')
@@ -312,15 +512,15 @@ def _parse_feeds(feeds: List[str], category: str, limit: int = 12) -> List[Dict]
                 title = e.get('title', 'Untitled')
                 summary = e.get('summary', '') or e.get('description', '')
                 published = e.get('published') or e.get('updated')
+                ts = None
                 try:
                     # Try to parse published date
                     if 'published_parsed' in e and e.published_parsed:
-                        dt = datetime(*e.published_parsed[:6])
-                        published_at = dt
+                        ts = calendar.timegm(e.published_parsed)
+                        published_at = datetime.fromtimestamp(ts, tz=dt_timezone.utc)
                     elif published:
                         # Try to parse the published string
                         try:
-                            from email.utils import parsedate_to_datetime
                             published_at = parsedate_to_datetime(published)
                         except:
                             published_at = django_timezone.now()
@@ -329,51 +529,125 @@ def _parse_feeds(feeds: List[str], category: str, limit: int = 12) -> List[Dict]
                 except Exception as ex:
                     print(f"Error parsing published date: {ex}")
                     published_at = django_timezone.now()
-                # Save to database
-                article, created = Article.objects.get_or_create(
+                if ts is None:
+                    if django_timezone.is_naive(published_at):
+                        published_at = django_timezone.make_aware(published_at)
+                    ts = calendar.timegm(published_at.utctimetuple())
+                excerpt = summary and _TAG_RE.sub('', summary)[:240]
+                # may scrape og:image over HTTP, so only once per entry
+                image = _pick_image(e, category)
+                read_time = _estimate_read_time(summary or title)
+                # Saved in one batch after all feeds are processed
+                articles.setdefault(link, Article(
                     url=link,
-                    defaults={
-                        'title': title,
-                        'excerpt': summary and re.sub('<[^<]+?>', '', summary)[:240],
-                        'author': getattr(e, 'author', '') or '',
-                        'published_at': published_at,
-                        'source': source_title,
-                        'category': category.capitalize(),
-                        'read_time': _estimate_read_time(summary or title),
-                        'image': _pick_image(e, category),
-                    }
-                )
+                    title=title,
+                    excerpt=excerpt,
+                    author=getattr(e, 'author', '') or '',
+                    published_at=published_at,
+                    source=source_title,
+                    category=category,
+                    read_time=read_time,
+                    image=image,
+                ))
 
                 item = {
-                    'id': _encode_id(link),
+                    'id': None,  # primary key, filled in once the article is saved
                     'title': title,
-                    'excerpt': summary and re.sub('<[^<]+?>', '', summary)[:240],
-                    'image': _pick_image(e, category),
+                    'excerpt': excerpt,
+                    'image': image,
                     'source': source_title,
-                    'publishedAt': _format_datetime(published_at),
+                    'publishedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(ts)),
                     'trending': False,
                     'author': getattr(e, 'author', None),
-                    'category': category.capitalize(),
-                    'readTime': _estimate_read_time(summary or title),
+                    'category': category,
+                    'readTime': read_time,
                     'link': link,
+                    '_ts': ts,  # epoch seconds, used for sorting only
                 }
                 items.append(item)
         except Exception as ex:
             print(f"Error parsing feed {url}: {ex}")
             continue
-    # Deduplicate by link id preserving order
-    seen = set()
-    deduped = []
+    # Save new articles: one SELECT for the known URLs, one batched INSERT for the rest
+    try:
+        with transaction.atomic():
+            pks = dict(Article.objects.filter(url__in=articles).values_list('url', 'id'))
+            new_articles = [a for link, a in articles.items() if link not in pks]
+            if new_articles:
+                Article.objects.bulk_create(new_articles, ignore_conflicts=True, batch_size=500)
+                # ignore_conflicts leaves pks unset, so read them back
+                pks.update(Article.objects.filter(
+                    url__in=[a.url for a in new_articles]
+                ).values_list('url', 'id'))
+    except Exception as ex:
+        print(f"Error saving articles for {category}: {ex}")
+        pks = {}
+    # Deduplicate by link in one pass, keeping the first occurrence
+    unique: Dict[str, Dict] = {}
     for it in items:
-        if it['id'] in seen:
-            continue
-        seen.add(it['id'])
-        deduped.append(it)
-    deduped.sort(key=lambda x: x['publishedAt'], reverse=True)
+        unique.setdefault(it['link'], it)
+    deduped = list(unique.values())
+    for it in deduped:
+        it['id'] = pks.get(it['link'])
+    deduped.sort(key=lambda x: x['_ts'], reverse=True)
+    deduped = deduped[:limit]
+    for it in deduped:
+        del it['_ts']
     # Mark some as trending
     for it in deduped[: min(5, len(deduped))]:
         it['trending'] = True
-    return deduped[:limit]
+    return deduped
+
+
+# Background scrapes triggered by news_detail: a small bounded pool, one job per URL at a time
+_SCRAPE_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix='scrape')
+_PENDING_SCRAPES: set[str] = set()
+_PENDING_LOCK = threading.Lock()
+
+
+def _scrape_and_save(pk: int, link: str) -> None:
+    try:
+        article_data = _scrape_article_content(link)
+        if article_data:
+            fields = {'content': article_data.get('content') or '', 'is_scraped': True}
+            if article_data.get('title'):
+                fields['title'] = article_data['title']
+            Article.objects.filter(pk=pk).update(**fields)
+            # drop the excerpt-only detail response so the next request sees the content
+            cache.delete(f"news_detail_{pk}")
+    except Exception as ex:
+        print(f"Error scraping {link}: {ex}")
+    finally:
+        with _PENDING_LOCK:
+            _PENDING_SCRAPES.discard(link)
+        connection.close()
+
+
+def _schedule_scrape(pk: int, link: str) -> None:
+    with _PENDING_LOCK:
+        if link in _PENDING_SCRAPES:
+            return
+        _PENDING_SCRAPES.add(link)
+    _SCRAPE_POOL.submit(_scrape_and_save, pk, link)
+
+
+def _refresh_category(category: str, limit: int = 100) -> None:
+    """Pull one category's feeds (every category for 'all') into the database."""
+    categories = CATEGORIES if category == 'all' else (category,)
+    try:
+        _prefetch_feeds([url for cat in categories for url in FEEDS[cat]])
+        for cat in categories:
+            _parse_feeds(FEEDS[cat], cat, limit=limit)
+    except Exception as ex:
+        print(f"Error refreshing {category} feeds: {ex}")
+    finally:
+        connection.close()
+
+
+def _request_refresh(category: str) -> None:
+    # cache.add is atomic, so only one cold request per minute queues a refresh for the category
+    if cache.add(f"refresh_lock_{category}", 1, 60):
+        _SCRAPE_POOL.submit(_refresh_category, category)
 
 
 @require_GET
@@ -384,126 +658,110 @@ def news_list(request):
     key = f"news_{category}_{limit}_{offset}"
     cached = cache.get(key)
     if cached:
-        return JsonResponse({'results': cached})
+        return OrjsonResponse(cached)
 
     # Query database instead of parsing RSS feeds
     queryset = Article.objects.all()
 
     if category != 'all':
-        queryset = queryset.filter(category__iexact=category.capitalize())
-
-    # Get total count for pagination info
-    total_count = queryset.count()
-
-    # Order by published date and apply pagination
-    articles = queryset.order_by('-published_at')[offset:offset + limit]
-
-    results = []
-    for article in articles:
-        item = {
-            'id': _encode_id(article.url),
-            'title': article.title,
-            'excerpt': article.excerpt,
-            'image': article.image,
-            'source': article.source,
-            'publishedAt': _format_datetime(article.published_at),
-            'trending': False,  # Could be determined by view count or other metrics
-            'author': article.author,
-            'category': article.category,
-            'readTime': article.read_time,
-            'link': article.url,
-        }
-        results.append(item)
+        queryset = queryset.filter(category=category)
+
+    # Order by published date and apply pagination; plain dicts skip model instantiation
+    rows = queryset.order_by('-published_at').values(
+        'id', 'url', 'title', 'excerpt', 'image', 'source', 'published_at',
+        'author', 'category', 'read_time',
+    )[offset:offset + limit]
+
+    fmt = _format_datetime
+    results = [{
+        'id': row['id'],
+        'title': row['title'],
+        'excerpt': row['excerpt'],
+        'image': row['image'],
+        'source': row['source'],
+        'publishedAt': fmt(row['published_at']),
+        'trending': False,  # Could be determined by view count or other metrics
+        'author': row['author'],
+        'category': row['category'],
+        'readTime': row['read_time'],
+        'link': row['url'],
+    } for row in rows]
 
     # Mark some as trending (first few)
     for item in results[:min(5, len(results))]:
         item['trending'] = True
 
-    # If no articles in database, trigger RSS parsing
-    if not results:
-        # Fallback to RSS parsing to populate database
-        if category == 'all':
-            all_items = []
-            for cat, feeds in FEEDS.items():
-                all_items.extend(_parse_feeds(feeds, cat, limit=100))
-            # Sort by publishedAt (which is now a string, so we need to handle that)
-            all_items.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
-            results = all_items[offset:offset + limit]
-        else:
-            feeds = FEEDS.get(category, FEEDS['world'])
-            all_items = _parse_feeds(feeds, category, limit=100)
-            results = all_items[offset:offset + limit]
+    # Empty database: never parse feeds on the request path, queue a refresh and let the client poll
+    if not results and not offset and (category == 'all' or category in CATEGORIES):
+        _request_refresh(category)
+        return OrjsonResponse({'results': [], 'refreshing': True})
 
-    cache.set(key, results, 300)  # Cache for 5 minutes
-    return JsonResponse({'results': results})
+    # Cache the encoded body so hits skip serialization entirely
+    body = orjson.dumps({'results': results})
+    cache.set(key, body, 900)  # Cache for 15 minutes
+    return OrjsonResponse(body)
 
 
 @require_GET
-def news_detail(request, item_id: str):
-    key = f"news_detail_{item_id}"
+def news_detail(request, pk: int):
+    key = f"news_detail_{pk}"
     cached = cache.get(key)
     if cached:
-        return JsonResponse(cached)
+        return OrjsonResponse(cached)
 
     try:
-        link = _decode_id(item_id)
-    except Exception:
-        return JsonResponse({'error': 'Invalid id'}, status=400)
-
-    # Try to get from database first
-    try:
-        article = Article.objects.get(url=link)
-        if article.is_scraped and article.content:
-            response_data = {
-                'id': item_id,
-                'link': link,
-                'title': article.title,
-                'content': article.content,
-                'scraped': True,
-                'author': article.author,
-                'publishedAt': _format_datetime(article.published_at),
-                'source': article.source,
-                'category': article.category,
-                'readTime': article.read_time,
-                'image': article.image,
-            }
-        else:
-            # Article exists but not scraped, trigger background scraping
-            from django.core.management import call_command
-            from threading import Thread
-            def scrape_async():
-                call_command('scrape_articles', urls=[link])
-            thread = Thread(target=scrape_async)
-            thread.daemon = True
-            thread.start()
-
-            response_data = {
-                'id': item_id,
-                'link': link,
-                'title': article.title,
-                'excerpt': article.excerpt,
-                'author': article.author,
-                'publishedAt': _format_datetime(article.published_at),
-                'source': article.source,
-                'category': article.category,
-                'readTime': article.read_time,
-                'image': article.image,
-            }
+        article = Article.objects.get(pk=pk)
     except Article.DoesNotExist:
-        # Article not in database, create it and trigger scraping
-        article = Article.objects.create(url=link)
-        from django.core.management import call_command
-        from threading import Thread
-        def scrape_async():
-            call_command('scrape_articles', urls=[link])
-        thread = Thread(target=scrape_async)
-        thread.daemon = True
-        thread.start()
+        return OrjsonResponse({'error': 'Article not found'}, status=404)
 
-        response_data = {'id': item_id, 'link': link}
+    link = article.url
+    if article.is_scraped and article.content:
+        response_data = {
+            'id': pk,
+            'link': link,
+            'title': article.title,
+            'content': article.content,
+            'scraped': True,
+            'author': article.author,
+            'publishedAt': _format_datetime(article.published_at),
+            'source': article.source,
+            'category': article.category,
+            'readTime': article.read_time,
+            'image': article.image,
+        }
+    else:
+        # Article exists but not scraped, trigger background scraping
+        _schedule_scrape(pk, link)
 
-    cache.set(key, response_data, 300)  # Cache for 5 minutes
-    return JsonResponse(response_data)
+        response_data = {
+            'id': pk,
+            'link': link,
+            'title': article.title,
+            'excerpt': article.excerpt,
+            'author': article.author,
+            'publishedAt': _format_datetime(article.published_at),
+            'source': article.source,
+            'category': article.category,
+            'readTime': article.read_time,
+            'image': article.image,
+        }
+
+    body = orjson.dumps(response_data)
+    cache.set(key, body, 300)  # Cache for 5 minutes
+    return OrjsonResponse(body)
+
+
+@require_GET
+def news_detail_legacy(request, item_id: str):
+    """Serve base64 URL ids issued before items were keyed by primary key."""
+    try:
+        link = _decode_id(item_id)
+    except Exception:
+        return OrjsonResponse({'error': 'Invalid id'}, status=400)
+    pk = Article.objects.filter(url=link).values_list('pk', flat=True).first()
+    if pk is None:
+        return OrjsonResponse({'error': 'Article not found'}, status=404)
+    return news_detail(request, pk)
 
 
 @require_GET
@@ -511,60 +769,62 @@ def trending(request):
     key = "trending"
     cached = cache.get(key)
     if cached:
-        return JsonResponse({'results': cached})
+        return OrjsonResponse(cached)
 
     # Get trending articles from database
-    articles = Article.objects.all().order_by('-published_at')[:20]
-
-    if not articles:
-        # Fallback to RSS parsing if no articles in database
-        items = []
-        for cat, feeds in FEEDS.items():
-            items.extend(_parse_feeds(feeds, cat, limit=5))
-        # Shuffle and slice
-        random.shuffle(items)
-        items = items[:10]
-    else:
-        # Convert articles to the expected format
-        items = []
-        for article in articles[:10]:
-            items.append({
-                'id': _encode_id(article.url),
-                'title': article.title,
-                'views': f"{random.randint(100, 2000)}K",
-                'timeAgo': 'recent',
-                'source': article.source,
-                'trending': True,
-                'publishedAt': _format_datetime(article.published_at),
-            })
-
-    cache.set(key, items, 300)  # Cache for 5 minutes
-    return JsonResponse({'results': items})
+    rows = list(Article.objects.order_by('-published_at').values(
+        'id', 'url', 'title', 'source', 'published_at',
+    )[:10])
+
+    if not rows:
+        _request_refresh('all')
+        return OrjsonResponse({'results': [], 'refreshing': True})
+
+    # Convert articles to the expected format
+    fmt = _format_datetime
+    items = [{
+        'id': row['id'],
+        'title': row['title'],
+        'views': f"{_stable_int(row['url'], 100, 2000)}K",
+        'timeAgo': 'recent',
+        'source': row['source'],
+        'trending': True,
+        'publishedAt': fmt(row['published_at']),
+    } for row in rows]
+
+    body = orjson.dumps({'results': items})
+    cache.set(key, body, 300)  # Cache for 5 minutes
+    return OrjsonResponse(body)
 
 
 ITUNES_SEARCH = 'https://itunes.apple.com/search'
 ITUNES_LOOKUP = 'https://itunes.apple.com/lookup'
 
 
-def _normalize_track(t):
-    duration_ms = t.get('trackTimeMillis') or 0
+def _fmt_duration(duration_ms: int | None) -> str:
+    if not duration_ms:
+        return '3:00'
     minutes = duration_ms // 60000
     seconds = (duration_ms % 60000) // 1000
-    duration = f"{minutes}:{seconds:02d}" if duration_ms else None
+    return f"{minutes}:{seconds:02d}"
+
+
+def _normalize_track(t):
+    track_id = t.get('trackId')
     return {
-        'id': t.get('trackId'),
+        'id': track_id,
         'title': t.get('trackName'),
         'artist': t.get('artistName'),
         'album': t.get('collectionName'),
-        'duration': duration or '3:00',
+        'duration': _fmt_duration(t.get('trackTimeMillis')),
         'genre': t.get('primaryGenreName'),
-        'rating': round(4.2 + random.random() * 0.6, 1),
-        'downloads': random.randint(3000, 20000),
+        'rating': round(4.2 + _stable_int(f"rating:{track_id}", 0, 60) / 100, 1),
+        'downloads': _stable_int(f"downloads:{track_id}", 3000, 20000),
         'image': t.get('artworkUrl100') or t.get('artworkUrl60') or 'https://picsum.photos/seed/music/300/300',
         'featured': False,
         'audioUrl': t.get('previewUrl'),
         'releaseDate': t.get('releaseDate', '')[:10],
-        'likes': random.randint(200, 5000),
+        'likes': _stable_int(f"likes:{track_id}", 200, 5000),
     }
 
 
@@ -577,22 +837,23 @@ def music_search(request):
     key = f"music_search_{term}_{limit}_{offset}_{country}"
     cached = cache.get(key)
     if cached:
-        return JsonResponse({'results': cached})
+        return OrjsonResponse(cached)
     params = {
         'term': term,
         'media': 'music',
         'limit': min(limit + offset, 50),  # Get more to handle offset
         'country': country,
     }
-    r = requests.get(ITUNES_SEARCH, params=params)
+    r = _SESSION.get(ITUNES_SEARCH, params=params, timeout=_TIMEOUT)
     r.raise_for_status()
     data = r.json()
     all_tracks = [_normalize_track(t) for t in data.get('results', []) if t.get('trackId')]
     tracks = all_tracks[offset:offset + limit]
     for t in tracks[: min(4, len(tracks))]:
         t['featured'] = True
-    cache.set(key, tracks, 300)  # Cache for 5 minutes
-    return JsonResponse({'results': tracks})
+    body = orjson.dumps({'results': tracks})
+    cache.set(key, body, 300)  # Cache for 5 minutes
+    return OrjsonResponse(body)
 
 
 @require_GET
@@ -600,18 +861,18 @@ def music_detail(request, track_id: int):
     key = f"music_detail_{track_id}"
     cached = cache.get(key)
     if cached:
-        return JsonResponse(cached)
+        return OrjsonResponse(cached)
     params = {'id': track_id}
-    r = requests.get(ITUNES_LOOKUP, params=params)
+    r = _SESSION.get(ITUNES_LOOKUP, params=params, timeout=_TIMEOUT)
     if r.status_code != 200:
-        return JsonResponse({'error': 'Track not found'}, status=404)
+        return OrjsonResponse({'error': 'Track not found'}, status=404)
     results = r.json().get('results', [])
     if not results:
-        return JsonResponse({'error': 'Track not found'}, status=404)
+        return OrjsonResponse({'error': 'Track not found'}, status=404)
     track = _normalize_track(results[0])
     # add some related tracks by same artist
     artist = results[0].get('artistName')
-    rel = requests.get(ITUNES_SEARCH, params={'term': artist, 'media': 'music', 'limit': 5})
+    rel = _SESSION.get(ITUNES_SEARCH, params={'term': artist, 'media': 'music', 'limit': 5}, timeout=_TIMEOUT)
     related = []
     if rel.status_code == 200:
         for t in rel.json().get('results', [])[:5]:
@@ -621,9 +882,10 @@ def music_detail(request, track_id: int):
                 'id': t.get('trackId'),
                 'title': t.get('trackName'),
                 'artist': t.get('artistName'),
-                'duration': _normalize_track(t)['duration'],
+                'duration': _fmt_duration(t.get('trackTimeMillis')),
                 'image': t.get('artworkUrl60') or t.get('artworkUrl100'),
             })
     track['relatedTracks'] = related
-    cache.set(key, track, 300)  # Cache for 5 minutes
-    return JsonResponse(track)
+    body = orjson.dumps(track)
+    cache.set(key, body, 300)  # Cache for 5 minutes
+    return OrjsonResponse(body)
@@ -63,6 +63,18 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # Wait for the scraper's write lock instead of failing with "database is locked"
+            'timeout': 20,
+            # WAL lets API reads run while the scraper writes
+            'init_command': (
+                'PRAGMA journal_mode=WAL;'
+                'PRAGMA synchronous=NORMAL;'
+                'PRAGMA cache_size=-64000;'
+                'PRAGMA temp_store=MEMORY;'
+                'PRAGMA mmap_size=268435456;'
+            ),
+        },
     }
 }
 
@@ -89,8 +101,22 @@ REST_FRAMEWORK = {
     ],
 }
 
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+# Use Redis when configured so all workers share one cache; otherwise a bounded per-process cache
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'OPTIONS': {
+                'MAX_ENTRIES': 5000,
+                'CULL_FREQUENCY': 4,
+            },
+        }
     }
-}